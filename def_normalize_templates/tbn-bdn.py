@@ -2,11 +2,6 @@ import re
 
 BRACE_BLOCK_RE = re.compile(r"(\s*\{[^}]+\})")
 
-POS_PREFIX_RE = re.compile(
-    r"^\s*(n|v|adj|adv|prep|conj|pron|interj)\.\s*",
-    re.IGNORECASE
-)
-
 def normalize_definitions(
     raw_definitions,
     term,
@@ -28,6 +23,9 @@ def normalize_definitions(
 
     normalized = []
 
+    term_lower = term.lower()
+    term_len = len(term)
+
     for item in raw_definitions:
         if not isinstance(item, str):
             text = str(item)
@@ -37,11 +35,19 @@ def normalize_definitions(
         text = text.strip()
 
         # Remove leading term repetition (very conservative)
-        if text.lower().startswith(term.lower()):
-            text = text[len(term):].lstrip(" .:-")
+        if text[:term_len].lower() == term_lower:
+            text = text[term_len:].lstrip(" .:-")
 
         # Rule 1: ", (" → newline
         text = text.replace(", (", "\n(")
+
+        # Fast path: no {...} blocks to split
+        if "{" not in text:
+            text = text.strip()
+            if text:
+                normalized.append(text)
+            continue
+
         text = text.replace(" {", "\n{")
 
         # Rule 2: split multiple {...} blocks onto new lines
@@ -50,22 +56,23 @@ def normalize_definitions(
         rebuilt_lines = []
         current = ""
 
+        # current is stripped when a segment starts and only grows on the
+        # right, so flushing it needs just an rstrip
         for part in parts:
             if not part:
                 continue
 
             if part.startswith("{"):
                 if current:
-                    rebuilt_lines.append(current.strip())
+                    rebuilt_lines.append(current.rstrip())
                 current = part.strip()
+            elif current:
+                current += part
             else:
-                if current:
-                    current += part
-                else:
-                    current = part.strip()
+                current = part.strip()
 
         if current:
-            rebuilt_lines.append(current.strip())
+            rebuilt_lines.append(current.rstrip())
 
         normalized.extend(rebuilt_lines)
 
@@ -1,13 +1,26 @@
 import argparse
+import os
 import sys
 import json
 from pathlib import Path
-import re
 import shutil
 from datetime import date
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 import zipfile
 from normalize import normalize_definitions
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# entry[2] == "non-lemma" marks a Dict1 non-lemma entry; anything else is
+# a lemma. Interned so interned tag fields can be compared by identity.
+NON_LEMMA = sys.intern("non-lemma")
+
 class PreImportValidationError(Exception):
     pass
 
@@ -46,15 +59,33 @@ def parse_args():
         action="store_true",
         help="Do not create zip file (leave output directory only)"
     )
+    parser.add_argument(
+        "--fast-zip",
+        action="store_true",
+        help="Store files in the zip without compression (faster, larger archive)"
+    )
+    parser.add_argument(
+        "--zip-level",
+        type=int,
+        choices=range(10),
+        default=1,
+        metavar="{0-9}",
+        help="Deflate compression level for the zip file (default: 1)"
+    )
     parser.add_argument(
         "--no-normalize",
         action="store_true",
         help="Disable definition normalization (use raw definitions from Dict2)"
     )
+    parser.add_argument(
+        "--strict-validate",
+        action="store_true",
+        help="Fully parse every output JSON file during pre-import validation"
+    )
     parser.add_argument(
         "--copy-reading",
         action="store_true",
-        help="Copy reading (index 1) from Dict1 when building Dict2-only entries"
+        help="No effect; kept for compatibility (Dict2-only entries have no Dict1 reading to copy)"
     )
 
 
@@ -105,73 +136,128 @@ def scan_dictionary(dir_path: Path):
         "term_banks": term_banks,
     }
 
-def iter_dict1_entries(dict1_files):
+def load_json(path: Path):
     """
-    Iterate over all term entries in Dict1 term_bank files.
+    Load a JSON file from raw bytes.
 
-    Yields:
-        tuple (entry, source_file)
-        - entry: list (length 8)
-        - source_file: Path of term_bank file
+    Uses orjson when it is installed, otherwise falls back to the stdlib
+    json module. Both raise json.JSONDecodeError on invalid input
+    (orjson.JSONDecodeError is a subclass of it).
     """
-    term_banks = dict1_files["term_banks"]
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-    for term_bank_path in term_banks:
-        with term_bank_path.open("r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON in {term_bank_path}: {e}")
+def write_json(path: Path, data, indent=False):
+    """
+    Write data to a JSON file.
 
-            if not isinstance(data, list):
-                raise ValueError(f"{term_bank_path} does not contain a JSON array")
+    Output is compact unless indent is True (2-space indentation).
+    Uses orjson when it is installed, otherwise falls back to the stdlib
+    json module with equivalent formatting. Non-string dict keys are
+    converted to strings in both cases.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        path.write_bytes(orjson.dumps(data, option=option))
+        return
 
-            for entry in data:
-                # Basic structural validation (lightweight)
-                if not isinstance(entry, list) or len(entry) != 8:
-                    raise ValueError(
-                        f"Invalid term entry in {term_bank_path}: {entry}"
-                    )
+    with path.open("w", encoding="utf-8") as f:
+        if indent:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        else:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
 
-                yield entry, term_bank_path
+def parse_term_bank(term_bank_path):
+    """
+    Load and validate a single term_bank file.
 
-def iter_dict2_entries(dict2_files):
+    Called in the main process for Dict1. For Dict2 it may run in a
+    worker process or in the main process.
+
+    Returns:
+        list of term entries (each a list of length 8)
     """
-    Iterate over all term entries in Dict2 term_bank files.
+    try:
+        data = load_json(term_bank_path)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {term_bank_path}: {e}")
 
-    Yields:
-        entry: list (length 8)
+    if not isinstance(data, list):
+        raise ValueError(f"{term_bank_path} does not contain a JSON array")
+
+    for entry in data:
+        # Basic structural validation (lightweight)
+        if (
+            not isinstance(entry, list)
+            or len(entry) != 8
+            or not isinstance(entry[0], str)
+        ):
+            raise ValueError(
+                f"Invalid term entry in {term_bank_path}: {entry}"
+            )
+
+    return data
+
+def parse_dict2_term_bank(term_bank_path, normalize=True):
     """
-    term_banks = dict2_files["term_banks"]
+    Load a Dict2 term_bank file and extract its definitions.
 
-    for term_bank_path in term_banks:
-        with term_bank_path.open("r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON in {term_bank_path}: {e}")
+    May run in a worker process (see map_term_banks) or in the main
+    process, so it must stay a top-level function.
+
+    Returns:
+        list of (term, definitions) pairs, in file order
+    """
+    pairs = []
+
+    for entry in parse_term_bank(term_bank_path):
+        term = entry[0]
+        raw_definitions = entry[5]
+
+        if normalize:
+            definitions = normalize_definitions(raw_definitions, term)
+        elif isinstance(raw_definitions, list):
+            # Freshly parsed and owned by nobody else; no copy needed
+            definitions = raw_definitions
+        else:
+            definitions = list(raw_definitions)
 
-            if not isinstance(data, list):
-                raise ValueError(f"{term_bank_path} does not contain a JSON array")
+        pairs.append((term, definitions))
 
-            for entry in data:
-                if not isinstance(entry, list) or len(entry) != 8:
-                    raise ValueError(
-                        f"Invalid term entry in {term_bank_path}: {entry}"
-                    )
+    return pairs
 
-                yield entry
+def map_term_banks(func, term_banks):
+    """
+    Apply func to every term_bank file in a process pool.
 
+    With only a couple of files (or a single CPU) the pool startup costs
+    more than it saves, so files are processed in this process instead.
 
-def is_non_lemma(entry):
+    Yields:
+        results of func, in the same order as term_banks
     """
-    Determine whether a term entry is a non-lemma entry.
+    workers = os.cpu_count() or 1
+
+    if workers == 1 or len(term_banks) <= 2:
+        yield from map(func, term_banks)
+        return
+
+    chunksize = max(1, len(term_banks) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(func, term_banks, chunksize=chunksize)
 
-    Rule:
-    - entry[2] == "non-lemma"  -> non-lemma
-    - otherwise               -> lemma
+def intern_if_str(value):
     """
-    return entry[2] == "non-lemma"
+    Return the interned copy of value if it is a string, else value.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
 
 def index_dict1(dict1_files):
     """
@@ -181,38 +267,44 @@ def index_dict1(dict1_files):
         lemma_index: dict[str, list[entry]]
         nonlemma_index: dict[str, list[entry]]
         nonlemma_by_term: dict[str, entry]
-        lemma_of_term: dict[str, str]
     """
-    lemma_index = {}
-    nonlemma_index = {}
+    lemma_index = defaultdict(list)
+    nonlemma_index = defaultdict(list)
     nonlemma_by_term = {}
-    lemma_of_term = {}
-
-    for entry, _src in iter_dict1_entries(dict1_files):
-        term = entry[0]
 
-        if is_non_lemma(entry):
-            # entry[5] = [[lemma, [tags...]]]
-            try:
-                redirect = entry[5][0][0]
-            except Exception:
-                raise ValueError(f"Invalid non-lemma structure: {entry}")
-
-            lemma = redirect
+    # Parsed in-process: a worker would only parse JSON, and unpickling
+    # its result in the parent costs more than the parse itself
+    for data in map(parse_term_bank, dict1_files["term_banks"]):
+        for entry in data:
+            # Intern terms so equal keys across Dict1/Dict2 share one object
+            term = entry[0] = sys.intern(entry[0])
+
+            # Tags, rules and term tags repeat heavily across entries
+            entry[2] = intern_if_str(entry[2])
+            entry[3] = intern_if_str(entry[3])
+            entry[7] = intern_if_str(entry[7])
+
+            # entry[2] was interned above, so identity implies equality
+            if entry[2] is NON_LEMMA:
+                # entry[5] = [[lemma, [tags...]]]
+                try:
+                    redirect = sys.intern(entry[5][0][0])
+                except Exception:
+                    raise ValueError(f"Invalid non-lemma structure: {entry}")
+
+                nonlemma_index[redirect].append(entry)
+                nonlemma_by_term[term] = entry
+            else:
+                lemma_index[term].append(entry)
 
-            nonlemma_index.setdefault(lemma, []).append(entry)
-            nonlemma_by_term[term] = entry
-            lemma_of_term[term] = lemma
-        else:
-            lemma = term
-            lemma_index.setdefault(lemma, []).append(entry)
-            lemma_of_term[term] = lemma
+    # Behave like plain dicts downstream (KeyError on missing keys)
+    lemma_index.default_factory = None
+    nonlemma_index.default_factory = None
 
     return (
         lemma_index,
         nonlemma_index,
         nonlemma_by_term,
-        lemma_of_term,
     )
 
 
@@ -221,52 +313,56 @@ def index_dict2(dict2_files, normalize=True):
     Build lemma set and definition map for Dict2.
 
     Returns:
-        dict2_lemmas: set[str]
+        dict2_lemmas: set-like view of str (keys of dict2_definitions)
         dict2_definitions: dict[str, list[str]]
     """
-    dict2_lemmas = set()
     dict2_definitions = {}
 
-    for entry in iter_dict2_entries(dict2_files):
-        term = entry[0]
-        raw_definitions = entry[5]
+    parse = partial(parse_dict2_term_bank, normalize=normalize)
 
-        if normalize:
-            definitions = normalize_definitions(raw_definitions, term)
-        else:
-            definitions = list(raw_definitions)
+    # Without normalization a worker would only parse JSON, which is no
+    # cheaper than unpickling its result here, so skip the pool as Dict1 does
+    mapper = map_term_banks if normalize else map
 
-        if term in dict2_definitions:
-            # Merge definitions instead of dropping
-            dict2_definitions[term].extend(definitions)
-        else:
-            dict2_lemmas.add(term)
-            dict2_definitions[term] = definitions
+    for pairs in mapper(parse, dict2_files["term_banks"]):
+        for term, definitions in pairs:
+            term = sys.intern(term)
+
+            if term in dict2_definitions:
+                # Merge definitions instead of dropping
+                dict2_definitions[term].extend(definitions)
+            else:
+                dict2_definitions[term] = definitions
 
-    return dict2_lemmas, dict2_definitions
+    # A keys view supports `in` and iteration without copying the keys
+    return dict2_definitions.keys(), dict2_definitions
 
 def merge_entries_from_dict2(
     dict2_lemmas,
     dict2_definitions,
     lemma_index,
     nonlemma_by_term,
-    lemma_of_term,
-    copy_reading=False,
 ):
     """
     Build merged entries driven strictly by Dict2 terms.
+
+    Dict1 lemma entries are updated in place (their definitions are
+    replaced) and become owned by the returned list; lemma_index must
+    not be merged again afterwards.
     """
     merged_entries = []
 
-    for term in sorted(dict2_lemmas):
+    # No sort here: main() sorts the combined output by term anyway
+    for term in dict2_lemmas:
         definitions = dict2_definitions[term]
 
         # Case 1: term is lemma in Dict1 → merge Dict1 metadata
-        if term in lemma_index:
-            for entry in lemma_index[term]:
-                new_entry = list(entry)
-                new_entry[5] = definitions
-                merged_entries.append(new_entry)
+        lemma_entries = lemma_index.get(term)
+        if lemma_entries is not None:
+            for entry in lemma_entries:
+                entry[5] = definitions
+            # One resize per term instead of one append per entry
+            merged_entries.extend(lemma_entries)
             continue
 
         # Case 2: term is non-lemma in Dict1 → keep Dict2 as-is
@@ -284,22 +380,11 @@ def merge_entries_from_dict2(
             merged_entries.append(entry)
             continue
 
-        # Case 3: Dict2-only entry
-        reading = ""
-
-        if copy_reading:
-            # Priority 1: same-term non-lemma in Dict1
-            if term in nonlemma_by_term:
-                reading = nonlemma_by_term[term][1]
-            else:
-                # Priority 2: lemma in Dict1
-                lemma = lemma_of_term.get(term)
-                if lemma and lemma in lemma_index:
-                    reading = lemma_index[lemma][0][1]
-
+        # Case 3: Dict2-only entry (not in Dict1, so there is no reading
+        # to take from it)
         entry = [
             term,
-            reading,
+            "",
             "",
             "",
             0,
@@ -315,25 +400,25 @@ def collect_nonlemma_redirects(nonlemma_index, dict2_lemmas):
     """
     Collect Dict1 non-lemma entries whose redirect target exists in Dict2.
     Used only to support deinflection.
-    """
-    redirects = []
-
-    for lemma, nonlemmas in nonlemma_index.items():
-        if lemma not in dict2_lemmas:
-            continue
 
-        for entry in nonlemmas:
-            redirects.append(list(entry))
-
-    return redirects
+    Entries are returned as-is (not copied); nothing mutates them later.
+    """
+    return [
+        entry
+        for lemma, nonlemmas in nonlemma_index.items()
+        if lemma in dict2_lemmas
+        for entry in nonlemmas
+    ]
 
 
 def chunk_entries(entries, chunk_size=10_000):
     """
     Yield chunks of entries with at most chunk_size elements.
 
+    Only one chunk is buffered at a time, so entries may be any iterable.
+
     Args:
-        entries: list of term entries
+        entries: iterable of term entries
         chunk_size: int
 
     Yields:
@@ -342,23 +427,53 @@ def chunk_entries(entries, chunk_size=10_000):
     if chunk_size <= 0:
         raise ValueError("chunk_size must be a positive integer")
 
-    for i in range(0, len(entries), chunk_size):
-        yield entries[i:i + chunk_size]
+    buf = []
+    for entry in entries:
+        buf.append(entry)
+        if len(buf) == chunk_size:
+            yield buf
+            buf = []
+
+    if buf:
+        yield buf
 
 def write_term_banks(chunks, output_dir):
     """
     Write term_bank_*.json files to output directory.
 
+    Chunks are serialized and written on a small thread pool, so disk
+    writes (which release the GIL) overlap with serializing other chunks.
+    At most 2 * max_workers chunks are in flight, so chunks are not all
+    held in memory at once when chunks is a generator.
+
     Args:
         chunks: iterable of list[entry]
         output_dir: Path
-    """
-    for idx, chunk in enumerate(chunks, start=1):
-        filename = f"term_bank_{idx}.json"
-        path = output_dir / filename
 
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(chunk, f, ensure_ascii=False, indent=2)
+    Returns:
+        int: number of term_bank files written
+    """
+    # At least two threads so one can write while another serializes
+    max_workers = max(2, min(8, os.cpu_count() or 1))
+    pending = deque()
+    count = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for idx, chunk in enumerate(chunks, start=1):
+            if len(pending) >= 2 * max_workers:
+                # Wait for the oldest write (re-raises its error, if any)
+                pending.popleft().result()
+
+            filename = f"term_bank_{idx}.json"
+            pending.append(
+                executor.submit(write_json, output_dir / filename, chunk)
+            )
+            count = idx
+
+        while pending:
+            pending.popleft().result()
+
+    return count
 
 def copy_tag_banks(dict1_dir, output_dir):
     """
@@ -391,11 +506,8 @@ def build_index_json(dict1_dir, dict2_dir, output_dir, title_override=None):
     index1_path = dict1_dir / "index.json"
     index2_path = dict2_dir / "index.json"
 
-    with index1_path.open("r", encoding="utf-8") as f:
-        index1 = json.load(f)
-
-    with index2_path.open("r", encoding="utf-8") as f:
-        index2 = json.load(f)
+    index1 = load_json(index1_path)
+    index2 = load_json(index2_path)
 
     output_index = {}
 
@@ -414,33 +526,71 @@ def build_index_json(dict1_dir, dict2_dir, output_dir, title_override=None):
     if title_override:
         output_index["title"] = title_override
 
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(output_index, f, ensure_ascii=False, indent=2)
+    write_json(output_path, output_index, indent=True)
 
-def zip_output_directory(output_dir, zip_path):
+def zip_output_directory(output_dir, zip_path, store_only=False, level=1):
     """
     Zip output directory into a Yomitan-importable .zip file.
 
+    Files are deflated at level 1 by default, which is several times
+    faster than zlib's default level 6 for only a slightly larger archive.
+
     Args:
         output_dir: Path
         zip_path: Path (should end with .zip)
+        store_only: bool, store files uncompressed (ZIP_STORED)
+        level: int, deflate compression level (0-9)
     """
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+    if store_only:
+        compression = zipfile.ZIP_STORED
+    else:
+        compression = zipfile.ZIP_DEFLATED
+
+    with zipfile.ZipFile(
+        zip_path,
+        "w",
+        compression=compression,
+        compresslevel=level,
+        allowZip64=True,
+    ) as zf:
         for path in output_dir.iterdir():
             if path.is_file():
                 zf.write(path, arcname=path.name)
 
-def validate_output_directory(output_dir):
+def read_json_bounds(path: Path, size=64):
+    """
+    Return the first and last non-whitespace bytes of a file.
+
+    Only the head and tail of the file are read.
+
+    Returns:
+        tuple (first, last) of bytes objects, empty if not found
+    """
+    with path.open("rb") as f:
+        head = f.read(size).lstrip()
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - size))
+        tail = f.read().rstrip()
+
+    return head[:1], tail[-1:]
+
+def validate_output_directory(output_dir, strict=False):
     """
     Validate output directory before zipping / importing into Yomitan.
 
     Checks:
-    - index.json exists and is valid JSON
+    - index.json exists and is a JSON object
     - at least one term_bank_*.json exists
-    - all JSON files can be loaded
+    - term_bank_*.json files are JSON arrays
+    - all other JSON files (tag banks copied from Dict1) can be loaded
+
+    index.json and term banks are written by this tool, so by default
+    only their outer brackets are checked. Files copied from Dict1 are
+    always fully parsed. With strict=True every JSON file is parsed.
 
     Args:
         output_dir: Path
+        strict: bool
 
     Raises:
         PreImportValidationError
@@ -455,14 +605,29 @@ def validate_output_directory(output_dir):
 
     # Validate all JSON files
     for path in output_dir.iterdir():
-        if path.is_file() and path.suffix == ".json":
+        if not path.is_file() or path.suffix != ".json":
+            continue
+
+        if path == index_path:
+            expected = (b"{", b"}")
+        elif path.name.startswith("term_bank_"):
+            expected = (b"[", b"]")
+        else:
+            expected = None
+
+        if strict or expected is None:
             try:
-                with path.open("r", encoding="utf-8") as f:
-                    json.load(f)
+                load_json(path)
             except Exception as e:
                 raise PreImportValidationError(
                     f"Invalid JSON file: {path.name} ({e})"
                 )
+            continue
+
+        if read_json_bounds(path) != expected:
+            raise PreImportValidationError(
+                f"Invalid JSON file: {path.name} (unexpected structure)"
+            )
 
 def sanity_check_redirects(entries):
     """
@@ -475,7 +640,7 @@ def sanity_check_redirects(entries):
     terms = {entry[0] for entry in entries}
 
     for entry in entries:
-        if entry[2] != "non-lemma":
+        if entry[2] != NON_LEMMA:
             continue
 
         # Validate redirect structure safely
@@ -532,7 +697,6 @@ def main():
         lemma_index,
         nonlemma_index,
         nonlemma_by_term,
-        lemma_of_term,
     ) = index_dict1(dict1_files)
 
 
@@ -551,8 +715,6 @@ def main():
         dict2_definitions,
         lemma_index,
         nonlemma_by_term,
-        lemma_of_term,
-        copy_reading=args.copy_reading,
     )
 
     nonlemma_redirects = collect_nonlemma_redirects(
@@ -560,22 +722,24 @@ def main():
         dict2_lemmas,
     )
 
-    all_entries = merged_entries + nonlemma_redirects
-    all_entries.sort(key=lambda e: e[0])
+    # Extend in place rather than concatenating into a third list
+    all_entries = merged_entries
+    all_entries.extend(nonlemma_redirects)
+    all_entries.sort(key=itemgetter(0))
 
     sanity_check_redirects(all_entries)
 
-    chunks = list(
+    print("Total merged entries:", len(all_entries))
+
+    term_bank_count = write_term_banks(
         chunk_entries(
             all_entries,
             chunk_size=args.chunk_size
-        )
+        ),
+        args.output
     )
 
-    print("Total merged entries:", len(all_entries))
-    print("Total term_bank files:", len(chunks))
-
-    write_term_banks(chunks, args.output)
+    print("Total term_bank files:", term_bank_count)
 
     # --------------------------------------------------
     # Phase 5: Metadata (tags + index)
@@ -592,14 +756,19 @@ def main():
     # --------------------------------------------------
     # Pre-import validation
     # --------------------------------------------------
-    validate_output_directory(args.output)
+    validate_output_directory(args.output, strict=args.strict_validate)
 
     # --------------------------------------------------
     # Phase 6: Zip (optional)
     # --------------------------------------------------
     if not args.no_zip:
         zip_path = args.output.with_suffix(".zip")
-        zip_output_directory(args.output, zip_path)
+        zip_output_directory(
+            args.output,
+            zip_path,
+            store_only=args.fast_zip,
+            level=args.zip_level
+        )
 
 
 if __name__ == "__main__":
@@ -2,15 +2,24 @@ import re
 
 JP_MARKER_RE = re.compile(r"`\d+`")
 
+# POS markers recognised by JP_POS_RE. Each alternative must start with a
+# literal letter: JP_POS_INITIALS is derived from these first letters
+JP_POS_ALTERNATIVES = (
+    r"n", r"pn", r"adv", r"exp", r"aux",
+    r"adj(?:-[a-z]+)?",
+    r"v(?:1|5[a-z]?|s|i|t)",
+)
+
 JP_POS_RE = re.compile(
-    r"^(?:"
-    r"n|pn|adv|exp|aux|"
-    r"adj(?:-[a-z]+)?|"
-    r"v(?:1|5[a-z]?|s|i|t)"
-    r")$",
+    r"^(?:" + "|".join(JP_POS_ALTERNATIVES) + r")$",
     re.IGNORECASE,
 )
 
+# First letters of every JP_POS_RE alternative (either case)
+JP_POS_INITIALS = frozenset(
+    c for alt in JP_POS_ALTERNATIVES for c in (alt[0].lower(), alt[0].upper())
+)
+
 
 def normalize_definitions(
     raw_definitions,
@@ -49,8 +58,8 @@ def normalize_definitions(
             if line == term:
                 continue
 
-            # Format POS line
-            if JP_POS_RE.match(line):
+            # Format POS line (cheap first-letter check before the regex)
+            if line[0] in JP_POS_INITIALS and JP_POS_RE.match(line):
                 line = f"〘{line.lower()}〙"
 
             lines.append(line)